@@ -98,3 +98,19 @@ def test_get_contraints_invalid(t, v):
     c = get_constraints(t)
     with pytest.raises(typic.ConstraintValueError):
         c.validate(v)
+
+
+@pytest.mark.parametrize(
+    argnames=("c", "expected"),
+    argvalues=[
+        (get_constraints(str), False),
+        (get_constraints(int), False),
+        (get_constraints(MyURL), False),
+        (typic.StrConstraints(max_length=5), True),
+        (typic.IntContraints(gt=1000), True),
+        (get_constraints(str, name="foo"), True),
+    ],
+    ids=repr,
+)
+def test_has_schema_flags(c, expected):
+    assert c.has_schema_flags is expected
@@ -66,6 +66,7 @@ def test_is_private(raw):
         ("://127.0.0.1",),
         ("mysql://",),
         ("othersql://192.168.1.1",),
+        ("mysql://localhost\n",),
     ],
 )
 def test_invalid_dsn(raw):
@@ -76,3 +76,10 @@ def test_invalid_email(raw):
 
 def test_is_named():
     assert PRETTY_EMAIL.info.is_named
+
+
+def test_email_pattern_groups():
+    match = email.EMAIL_PATTERN.match("foo@bar.com")
+    assert match["domain"] == "bar.com"
+    assert match["localhost"] is match["dotless"] is None
+    assert email.EMAIL_PATTERN.match("foo@localhost")["localhost"] == "localhost"
@@ -1,7 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import dataclasses
 from datetime import datetime
-from typing import List, Tuple, Set, Union, Mapping, Dict, Any, DefaultDict
+from typing import (
+    List,
+    Tuple,
+    Set,
+    Union,
+    Mapping,
+    Dict,
+    Any,
+    DefaultDict,
+    Optional,
+)
 
 import pytest
 import typic
@@ -12,6 +23,7 @@ from typic.ext.schema import (
     get_field_type,
 )
 from typic.compat import Final
+from typic.ext.schema.field import SCHEMA_FIELD_FORMATS
 from tests import objects
 
 
@@ -93,6 +105,15 @@ class Container:
                 anyOf=(typic.StrSchemaField(), typic.IntSchemaField())
             ),
         ),
+        (
+            Optional[List[str]],
+            typic.MultiSchemaField(
+                anyOf=(
+                    typic.ArraySchemaField(items=typic.StrSchemaField()),
+                    typic.NullSchemaField(),
+                )
+            ),
+        ),
         (
             Mapping[str, int],
             typic.ObjectSchemaField(additionalProperties=typic.IntSchemaField()),
@@ -336,3 +357,122 @@ def test_get_field_type(type, expected):
 
 def test_ref_primitive():
     assert typic.Ref("foo").primitive() == {"$ref": "foo"}
+
+
+def test_builder_clear_caches():
+    builder = typic.SchemaBuilder()
+    protocol = typic.protocol(List[str])
+    schema = builder.get_field(protocol)
+    builder.clear_caches()
+    assert builder.get_field(protocol) == schema
+
+
+@typic.klass
+class Common:
+    x: int
+
+
+@typic.klass
+class Left:
+    common: Common
+
+
+@typic.klass
+class Right:
+    common: Common
+
+
+def test_union_shared_nested_schema():
+    schema = typic.schema(Union[Left, Right])
+    ref = typic.Ref(ref="#/definitions/Common")
+    for field in schema.anyOf:
+        assert field.properties["common"] == ref
+        assert "Common" in field.definitions
+
+
+def test_schema_field_replace():
+    field = typic.StrSchemaField(maxLength=5)
+    assert field._replace(title="Foo") == dataclasses.replace(field, title="Foo")
+    with pytest.raises(TypeError):
+        field._replace(foo="bar")
+
+
+def test_array_items_ordered_unique():
+    schema = typic.schema(Tuple[str, int, str])
+    assert schema.items == (typic.StrSchemaField(), typic.IntSchemaField())
+
+
+class Unbuildable:
+    ...
+
+
+def test_failed_schema_not_rebuilt(monkeypatch):
+    builder = typic.SchemaBuilder()
+    calls = []
+
+    def build_schema(obj, *, name=None):
+        calls.append(obj)
+        raise TypeError("nope")
+
+    monkeypatch.setattr(builder, "build_schema", build_schema)
+    with pytest.warns(UserWarning):
+        schema = builder.get_field(typic.protocol(Unbuildable))
+    ro_schema = builder.get_field(typic.protocol(typic.common.ReadOnly[Unbuildable]))
+    assert schema == typic.UndeclaredSchemaField(title="Unbuildable")
+    assert ro_schema == typic.UndeclaredSchemaField(title="Unbuildable", readOnly=True)
+    assert calls == [Unbuildable]
+
+
+@pytest.mark.parametrize(
+    argnames=("field",),
+    argvalues=[
+        (typic.ObjectSchemaField(title="Foo"),),
+        (typic.ArraySchemaField(title="Foo"),),
+        (typic.MultiSchemaField(title="Foo"),),
+    ],
+)
+def test_schema_field_slotted(field):
+    replaced = field._replace(title="Bar")
+    assert not field.__dict__ and not replaced.__dict__
+    assert replaced.title == "Bar"
+
+
+def test_builder_maxsize():
+    builder = typic.SchemaBuilder(maxsize=1)
+    str_schema = builder.get_field(typic.protocol(List[str]))
+    builder.get_field(typic.protocol(List[int]))
+    assert builder.get_field(typic.protocol(List[str])) == str_schema
+    assert len(builder._SchemaBuilder__cache) == 1
+
+
+def test_builder_maxsize_bounds_all_caches(monkeypatch):
+    builder = typic.SchemaBuilder(maxsize=2)
+    for t in (List[str], List[int], List[float], Dict[str, int], Set[str]):
+        builder.get_field(builder._resolve(t))
+        builder.defname(t)
+        builder._ref(repr(t))
+
+    def fail(obj, *, name=None):
+        raise TypeError(obj)
+
+    monkeypatch.setattr(builder, "build_schema", fail)
+    for _ in range(4):
+
+        @dataclasses.dataclass
+        class Foo:
+            bar: str
+
+        with pytest.warns(UserWarning):
+            builder.get_field(typic.protocol(Foo))
+
+    assert len(builder._SchemaBuilder__cache) <= 2
+    assert builder._resolve.cache_info().currsize <= 2
+    assert builder._ref.cache_info().currsize <= 2
+    assert len(builder._defname_cache) <= 2
+    assert len(builder._base_by_id) <= 2
+    assert len(builder._failed) == 2
+
+
+@pytest.mark.parametrize(argnames=("obj",), argvalues=[(str,), (datetime,), (list,)])
+def test_schema_shared_base(obj):
+    assert typic.schema(obj) is SCHEMA_FIELD_FORMATS[obj]
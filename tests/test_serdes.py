@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import dataclasses
 import datetime
 import decimal
 import enum
@@ -56,6 +57,10 @@ class SubURL(typic.URL):
     ...
 
 
+class SubSecret(typic.SecretStr):
+    ...
+
+
 @pytest.mark.parametrize(
     argnames=("obj", "expected"),
     argvalues=[
@@ -76,6 +81,8 @@ class SubURL(typic.URL):
         (ipaddress.IPv4Address("0.0.0.0"), "0.0.0.0"),
         (re.compile(r"foo"), "foo"),
         (datetime.datetime(1970, 1, 1), "1970-01-01T00:00:00+00:00"),
+        (datetime.date(1970, 1, 1), "1970-01-01"),
+        (datetime.time(12), "12:00:00+00:00"),
         (
             datetime.datetime(
                 1970, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
@@ -101,6 +108,9 @@ class SubURL(typic.URL):
         ([typic.URL("foo")], ["foo"]),
         (SubStr("foo"), "foo"),
         (SubURL("foo"), "foo"),
+        (SubSecret("foo"), "foo"),
+        (typic.SecretBytes(b"foo"), "foo"),
+        (datetime.timedelta(seconds=1), 1.0),
         (ClassVarEnum(), {"foo": objects.FooNum.bar.value}),
     ],
     ids=repr,
@@ -144,6 +154,8 @@ class CaseDict(Dict):
         (Optional[objects.Typic], objects.Typic(var="foo"), {"var": "foo"}),
         (MultiNum, MultiNum.INT, 1),
         (MultiNum, MultiNum.STR, "str"),
+        (Optional[MultiNum], None, None),
+        (objects.FooNum, objects.FooNum.bar, "bar"),
         (
             Dict[objects.FooNum, objects.Typic],
             {objects.FooNum.bar: objects.Typic(var="foo")},
@@ -159,6 +171,22 @@ def test_serde_serializer(t, obj, prim):
     assert r.primitive(obj) == prim
 
 
+class SingleNum(enum.Enum):
+    ONE = "one"
+
+
+@pytest.mark.parametrize(argnames="value", argvalues=["one", 1, None, [1]])
+def test_enum_serializer_non_member(value):
+    with pytest.raises(AttributeError):
+        typic.protocol(SingleNum).serializer(value)
+
+
+def test_optional_enum_serializer():
+    serializer = typic.protocol(Optional[SingleNum]).serializer
+    assert serializer(None) is None
+    assert serializer(SingleNum.ONE) == "one"
+
+
 @pytest.mark.parametrize(
     argnames=("t", "obj", "prim"),
     argvalues=[
@@ -277,3 +305,140 @@ def test_inherited_serde_flags():
     assert Bar.__serde_flags__.fields.keys() == {"a", "b", "c"}
     assert Bar.__serde_flags__.exclude == {"b"}
     assert Bar.__serde_flags__.omit == (1, 2)
+
+
+def test_serializer_cached_by_annotation():
+    anno = typic.resolver.annotation(Dict[str, objects.Typic])
+    factory = typic.resolver.ser
+    assert factory.factory(anno) is factory.factory(anno)
+
+
+@pytest.mark.parametrize(
+    argnames=("omit", "expected"),
+    argvalues=[((None,), {"items": []}), (("foo",), {"name": None, "items": []})],
+)
+def test_omit_values(omit, expected):
+    @typic.klass(serde=typic.SerdeFlags(omit=omit))
+    class Omitted:
+        name: Optional[str] = None
+        items: List[str] = typic.field(default_factory=list)
+
+    assert typic.primitive(Omitted()) == expected
+
+
+@pytest.mark.parametrize(argnames="nfields", argvalues=[1, 65])
+def test_class_serializer_lazy_matches_eager(nfields):
+    Wide = dataclasses.make_dataclass(
+        "Wide", [(f"f{i}", int, dataclasses.field(default=i)) for i in range(nfields)]
+    )
+    proto = typic.protocol(Wide)
+    expected = {f"f{i}": i for i in range(nfields)}
+    assert proto.primitive(Wide()) == dict(proto.primitive(Wide(), lazy=True))
+    assert proto.primitive(Wide()) == expected
+    assert type(proto.primitive(Wide())) is dict
+
+
+def test_serde_flags_type_checking():
+    @typic.klass(serde=typic.SerdeFlags(type_checking=False))
+    class Unchecked:
+        foo: str
+
+    @typic.klass
+    class Checked:
+        foo: str
+
+    assert Unchecked.__serde_flags__.type_checking is False
+    assert typic.primitive(Unchecked(foo="bar")) == {"foo": "bar"}
+    assert typic.protocol(Unchecked).primitive(Checked(foo="bar")) == {"foo": "bar"}
+    with pytest.raises(ValueError):
+        typic.protocol(Checked).primitive(Unchecked(foo="bar"))
+
+
+def test_unchecked_primitive_list():
+    flags = typic.SerdeFlags(type_checking=False)
+    proto = typic.resolver.resolve(List[int], flags=flags)
+    checked = typic.resolver.resolve(List[int])
+    value = [1, 2, 3]
+    assert proto.primitive(value) == checked.primitive(value) == value
+    assert proto.primitive(value) is not value
+    assert type(proto.primitive(value)) is list
+
+
+class OmitDict(Dict):
+    __serde_flags__ = typic.SerdeFlags(omit=(None,))
+
+
+def test_dict_serializer_omit():
+    proto = typic.resolver.resolve(OmitDict)
+    value = OmitDict(a=1, b=None, c=[])
+    assert proto.primitive(value) == {"a": 1, "c": []}
+    assert dict(proto.primitive(value, lazy=True)) == {"a": 1, "c": []}
+
+
+class KeyEnum(enum.Enum):
+    A = "a"
+
+
+@pytest.mark.parametrize(argnames="omit", argvalues=[None, (2,)])
+def test_dict_serializer_value_name_uses_serialized_key(omit, monkeypatch):
+    flags = typic.SerdeFlags(omit=omit) if omit else None
+    serializer = typic.protocol(Dict[KeyEnum, List[int]], flags=flags).serializer
+    names = []
+
+    def vser(v, *, lazy=False, name=None):
+        names.append(name)
+        return v
+
+    monkeypatch.setitem(serializer.__globals__, "vser", vser)
+    assert serializer({KeyEnum.A: [1]}) == {"a": [1]}
+    assert [n.keys for n in names] == [("a",)]
+
+
+def test_serde_config_cached_out_fields():
+    config = typic.resolver.resolve(FieldMapp).annotation.serde
+    assert config.omit_set == frozenset()
+    assert config.fields_getters_out.keys() == {"foo"}
+    assert config.fields_getters_out is config.fields_getters_out
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected"),
+    argvalues=[
+        (datetime.date(2020, 1, 1), "2020-01-01"),
+        (datetime.datetime(2020, 1, 1), "2020-01-01T00:00:00+00:00"),
+    ],
+)
+def test_date_protocol_primitive(value, expected):
+    assert typic.protocol(datetime.date).primitive(value) == expected
+
+
+def test_orjson_dumps():
+    pytest.importorskip("orjson")
+    dumps = typic.ext.json._orjson_dumps
+    assert dumps({1: ["a"]}) == '{"1":["a"]}'
+    assert dumps({"a": "é"}, ensure_ascii=True) == typic.ext.json._fallback_dumps(
+        {"a": "é"}, indent=0, ensure_ascii=True
+    )
+    prim = typic.primitive(Bar(foos=[Foo("bar")]))
+    assert dumps(prim) == '{"foos":[{"bar":"bar","id":null}]}'
+
+
+@pytest.mark.parametrize(argnames="value", argvalues=[2 ** 63, 2 ** 70, -(2 ** 70)])
+def test_orjson_dumps_large_int(value, monkeypatch):
+    pytest.importorskip("orjson")
+    calls = []
+
+    def fallback(obj, **kwargs):
+        calls.append((obj, kwargs))
+        return "fallback"
+
+    monkeypatch.setattr(typic.ext.json, "_fallback_dumps", fallback)
+    assert typic.ext.json._orjson_dumps(value, indent=2) == "fallback"
+    assert calls == [(value, {"indent": 2, "ensure_ascii": False})]
+
+
+def test_orjson_opt_in():
+    pytest.importorskip("orjson")
+    assert typic.ext.json.dumps is not typic.ext.json._orjson_dumps
+    assert typic.ext.json.loads is not typic.ext.json.orjson.loads
+    assert typic.tojson(2 ** 63) == str(2 ** 63)
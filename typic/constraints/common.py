@@ -98,6 +98,11 @@ class __AbstractConstraints(abc.ABC):
     def type_qualname(self) -> str:
         return util.get_qualname(self.type)
 
+    @util.cached_property
+    def has_schema_flags(self) -> bool:
+        """Whether these constraints contribute anything to a JSON Schema."""
+        return bool(self.for_schema())
+
     def _get_validator_name(self) -> str:
         return util.get_defname("validator", self)
 
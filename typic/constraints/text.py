@@ -62,7 +62,7 @@ class TextConstraints(BaseConstraints):
         )
         if with_type:
             schema["type"] = "string"
-        return {x: y for x, y in schema.items() if x is not None}
+        return {x: y for x, y in schema.items() if y is not None}
 
 
 @util.slotted
@@ -1,3 +1,4 @@
+import os
 from typing import Callable, Any, AnyStr
 
 dumps: Callable[..., AnyStr]
@@ -19,5 +20,38 @@ except (ImportError, ModuleNotFoundError):  # pragma: nocover
     loads = json.loads
 
 
+try:
+    import orjson  # type: ignore
+
+except (ImportError, ModuleNotFoundError):  # pragma: nocover
+    pass
+
+else:
+    _fallback_dumps = dumps
+    _OPTIONS = orjson.OPT_NON_STR_KEYS  # type: ignore
+    _INDENTED = _OPTIONS | orjson.OPT_INDENT_2  # type: ignore
+
+    def _orjson_dumps(
+        obj: Any, *, indent: int = 0, ensure_ascii: bool = False, **kwargs
+    ) -> str:
+        # orjson only supports a subset of the usual options.
+        if ensure_ascii or kwargs or indent not in (0, 2):
+            return _fallback_dumps(
+                obj, indent=indent, ensure_ascii=ensure_ascii, **kwargs
+            )
+        option = _INDENTED if indent else _OPTIONS
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        # orjson can't encode some valid input, e.g., integers wider than 64 bits.
+        except TypeError:
+            return _fallback_dumps(
+                obj, indent=indent, ensure_ascii=ensure_ascii, **kwargs
+            )
+
+    # orjson writes NaN & Infinity as `null`, so it must be requested explicitly.
+    if os.environ.get("TYPIC_ORJSON", "").lower() in {"1", "true", "yes"}:
+        dumps = _orjson_dumps  # type: ignore
+
+
 def using_stdlib() -> bool:
     return NATIVE_JSON
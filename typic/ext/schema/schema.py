@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
-import dataclasses
 import enum
+import functools
 import warnings
 from typing import (
     Union,
@@ -11,6 +11,8 @@ from typing import (
     Dict,
     Any,
     List,
+    Tuple,
+    Set,
     Generic,
     cast,
     AnyStr,
@@ -19,7 +21,7 @@ from typing import (
 
 import inflection  # type: ignore
 
-from typic.common import ReadOnly, WriteOnly
+from typic.common import EMPTY, ReadOnly, WriteOnly
 from typic.serde.resolver import resolver
 from typic.serde.common import SerdeProtocol
 from typic.compat import Final, TypedDict, ForwardRef
@@ -47,6 +49,23 @@ __all__ = ("SchemaBuilder", "SchemaDefinitions", "builder")
 
 
 _KNOWN = (*(f for f in SCHEMA_FIELD_FORMATS.keys() if f not in {AnyStr, object}),)
+_MISS = object()
+_UNDECLARED = frozenset((Any, EMPTY))
+_RO_WO_FINAL = frozenset((ReadOnly, WriteOnly, Final))
+_RO_FINAL = frozenset((ReadOnly, Final))
+_TUPLE_FROZEN = frozenset((tuple, frozenset))
+_SET_FROZEN = frozenset((set, frozenset))
+_NESTED = (ObjectSchemaField, ArraySchemaField, MultiSchemaField)
+_PRIMITIVE_BASES: Dict[Type, SchemaFieldT] = {
+    t: cast(SchemaFieldT, SCHEMA_FIELD_FORMATS[t]) for t in (str, int, float, bool)
+}
+
+
+_DEF_PREFIX = "#/definitions/"
+
+
+def _make_ref(name: Optional[str]) -> Ref:
+    return Ref(f"{_DEF_PREFIX}{name}")
 
 
 class SchemaDefinitions(TypedDict):
@@ -63,20 +82,76 @@ class SchemaBuilder:
     This shouldn't be used directly.
     Schema generation is handled automatically when a class is wrapped.
 
+    Parameters
+    ----------
+    maxsize
+        The maximum number of entries to keep in each of the builder's caches
+        (default unbounded). Once reached, the oldest entries are evicted. Evicted
+        schemas are rebuilt on demand, but won't show up in
+        :py:meth:`SchemaBuilder.all` until then.
+
     See Also
     --------
     :py:func:`~typic.typed.glob.wrap_cls`
     :py:func:`~typic.klass.klass`
     """
 
-    def __init__(self):
-        self.__cache = {}
-        self.__attached = set()
-        self.__stack = set()
+    def __init__(self, maxsize: int = None):
+        # Keyed by `id()`, entries hold a reference to the key so it can't be recycled.
+        self.__cache: Dict[int, Tuple[Any, SchemaFieldT]] = {}
+        self.maxsize = maxsize
+        self.__attached: Set[Type] = set()
+        self.__stack: Set[int] = set()
+        # An insertion-ordered "set", so the oldest entries can be evicted.
+        self._failed: Dict[Type, None] = {}
+        self._resolve = functools.lru_cache(maxsize=maxsize)(self._resolve_impl)
+        # Refs are frozen, so we can safely share one instance per name.
+        self._ref = functools.lru_cache(maxsize=maxsize)(_make_ref)
+        self._base_by_id: Dict[int, Tuple[Type, Optional[SchemaFieldT]]] = {}
+        self._defname_cache: Dict[
+            Tuple[int, Optional[str]], Tuple[Any, Optional[str]]
+        ] = {}
 
     def attach(self, t: Type):
         self.__attached.add(t)
 
+    @staticmethod
+    def _resolve_impl(
+        t: Type, parent: Type = None, is_optional: bool = None
+    ) -> SerdeProtocol:
+        return resolver.resolve(t, namespace=parent, is_optional=is_optional)
+
+    def _base_for(self, use: Type) -> Optional[SchemaFieldT]:
+        key = id(use)
+        # Hold a reference to `use` so its id can't be recycled.
+        entry: Any = self._base_by_id.get(key, _MISS)
+        if entry is _MISS:
+            entry = (
+                use,
+                cast(Optional[SchemaFieldT], SCHEMA_FIELD_FORMATS.get_by_parent(use)),
+            )
+            self._bounded_set(self._base_by_id, key, entry)
+        return entry[1]
+
+    def _bounded_set(self, table: Dict, key: Any, value: Any):
+        table[key] = value
+        # Evict the oldest entries first.
+        if self.maxsize is not None and len(table) > self.maxsize:
+            del table[next(iter(table))]
+
+    def _cache(self, key: int, entry: Tuple[Any, SchemaFieldT]):
+        self._bounded_set(self.__cache, key, entry)
+
+    def clear_caches(self):
+        """Clear all resolved protocols and schema definitions from this builder."""
+        self._resolve.cache_clear()
+        self._ref.cache_clear()
+        self._base_by_id.clear()
+        self._defname_cache.clear()
+        self._failed.clear()
+        self.__cache.clear()
+        self.__stack.clear()
+
     def _handle_mapping(
         self, proto: "SerdeProtocol", parent: Type = None, *, name: str = None, **extra
     ) -> Mapping:
@@ -99,8 +174,8 @@ class SchemaBuilder:
             if items:
                 config[target] = {
                     nm: self.get_field(
-                        resolver.resolve(
-                            it.type, namespace=parent, is_optional=it.nullable
+                        self._resolve(
+                            it.type, parent, it.nullable  # type: ignore[arg-type]
                         ),
                         parent=parent,
                     )
@@ -109,7 +184,8 @@ class SchemaBuilder:
         config["additionalProperties"] = not constraints.total
         if args:
             config["additionalProperties"] = self.get_field(
-                resolver.resolve(args[-1], namespace=parent), parent=parent
+                self._resolve(args[-1], parent),  # type: ignore[arg-type]
+                parent=parent,
             )
 
         return config
@@ -124,14 +200,20 @@ class SchemaBuilder:
         if has_ellipsis:
             args = args[:-1]
         if args:
-            constrs = set(
-                self.get_field(resolver.resolve(x, namespace=parent), parent=parent)
-                for x in args
+            # Order-preserving de-duplication.
+            constrs = (
+                *dict.fromkeys(
+                    self.get_field(
+                        self._resolve(x, parent),  # type: ignore[arg-type]
+                        parent=parent,
+                    )
+                    for x in args
+                ),
             )
-            config["items"] = (*constrs,) if len(constrs) > 1 else constrs.pop()
-            if anno.origin in {tuple, frozenset}:
+            config["items"] = constrs if len(constrs) > 1 else constrs[0]
+            if anno.origin in _TUPLE_FROZEN:
                 config["additionalItems"] = False if not has_ellipsis else None
-            if anno.origin in {set, frozenset}:
+            if anno.origin in _SET_FROZEN:
                 config["uniqueItems"] = True
         return config
 
@@ -145,25 +227,53 @@ class SchemaBuilder:
         parent: Type = None,
     ) -> "SchemaFieldT":
         """Get a field definition for a JSON Schema."""
-        if protocol.annotation in self.__stack:
-            name = self.defname(protocol.annotation.resolved_origin, name)
-            return Ref(f"#/definitions/{name}")
-        self.__stack.add(protocol.annotation)
         anno = protocol.annotation
-        if anno in self.__cache:
-            return self.__cache[anno]
+        key = id(anno)
+        entry = self.__cache.get(key)
+        if entry is not None:
+            return entry[1]
+        if key in self.__stack:
+            name = self.defname(anno.resolved_origin, name)
+            return self._ref(name)
+        self.__stack.add(key)
+        try:
+            field = self._build_field(protocol, ro=ro, wo=wo, name=name, parent=parent)
+        finally:
+            self.__stack.discard(key)
+        self._cache(key, (anno, field))
+        return field
+
+    def _build_field(
+        self,
+        protocol: SerdeProtocol,
+        *,
+        ro: bool = None,
+        wo: bool = None,
+        name: str = None,
+        parent: Type = None,
+    ) -> "SchemaFieldT":
+        anno = protocol.annotation
         # Get the default value
         # `None` gets filtered out down the line. this is okay.
         # If a field isn't required an empty default is functionally the same
         # as a default to None for the JSON schema.
         default = anno.parameter.default if anno.has_default else None
         # `use` is the based annotation we will use for building the schema
-        use = getattr(anno.origin, "__parent__", anno.origin)
+        use = anno.origin_parent
         # If there's not a static annotation, short-circuit the rest of the checks.
         schema: SchemaFieldT
-        if use in {Any, anno.EMPTY}:
+        if use in _UNDECLARED:
             schema = UndeclaredSchemaField()
-            self.__cache[anno] = schema
+            return schema
+
+        # Unconstrained primitives without any extra configuration are just the base.
+        if (
+            use in _PRIMITIVE_BASES
+            and not (ro or wo)
+            and default is None
+            and not (protocol.constraints and protocol.constraints.has_schema_flags)
+        ):
+            schema = _PRIMITIVE_BASES[use]
             return schema
 
         # Unions are `anyOf`, get a new field for each arg and return.
@@ -171,29 +281,30 @@ class SchemaBuilder:
         #   {'oneOf': [{'type': 'string'}, {'type': 'integer'}]}
         # We don't care about syntactic sugar if it's functionally the same.
         if use is Union:
-            fields: List[SchemaFieldT] = []
+            # `anno.args` may belong to the inner type of an unwrapped `Optional`,
+            # so we need the args of the original annotation.
             args = get_args(anno.un_resolved)
-            for t in args:
-                if t.__class__ is ForwardRef or t is parent:
-                    n = name or get_name(t)
-                    fields.append(Ref(f"#/definitions/{n}"))
-                    continue
-                fields.append(
-                    self.get_field(resolver.resolve(t, namespace=parent), parent=parent)
-                )
             schema = MultiSchemaField(
                 title=self.defname(anno.resolved, name=name) if name else None,
-                anyOf=(*fields,),
+                anyOf=(
+                    *(
+                        self._ref(name or get_name(t))
+                        if t.__class__ is ForwardRef or t is parent
+                        else self.get_field(
+                            self._resolve(t, parent),  # type: ignore[arg-type]
+                            parent=parent,
+                        )
+                        for t in args
+                    ),
+                ),
             )
-            self.__cache[anno] = schema
             return schema
 
         # Check if this should be ro/wo
-        if use in {ReadOnly, WriteOnly, Final}:
-            ro = (use in {ReadOnly, Final}) or None
+        if use in _RO_WO_FINAL:
+            ro = (use in _RO_FINAL) or None
             wo = (use is WriteOnly) or None
-            use = origin(anno.resolved)
-            use = getattr(use, "__parent__", use)
+            use = anno.resolved_parent
 
         # Check for an enumeration
         enum_ = None
@@ -215,9 +326,14 @@ class SchemaBuilder:
         elif istypeddict(use) or isnamedtuple(use):
             base = None
         else:
-            base = cast(SchemaFieldT, SCHEMA_FIELD_FORMATS.get_by_parent(use))
+            base = cast(SchemaFieldT, self._base_for(use))
         if base:
-            config = protocol.constraints.for_schema() if protocol.constraints else {}
+            constraints = protocol.constraints
+            config = (
+                constraints.for_schema()
+                if constraints and constraints.has_schema_flags
+                else {}
+            )
             config.update(enum=enum_, default=default, readOnly=ro, writeOnly=wo)
             # `use` should always be a dict if the annotation is a Mapping,
             # thanks to `origin()` & `resolve()`.
@@ -227,12 +343,22 @@ class SchemaBuilder:
                 )
             elif isinstance(base, ArraySchemaField):
                 config = self._handle_array(protocol, parent=parent, **config)
-            schema = dataclasses.replace(base, **config)
+            # Re-use the shared base field if there's nothing to change.
+            if all(getattr(base, k) is v for k, v in config.items()):
+                schema = base
+            else:
+                schema = base._replace(**config)  # type: ignore
         else:
-            try:
-                schema = self.build_schema(use, name=self.defname(use, name=name))
-            except (ValueError, TypeError) as e:
-                warnings.warn(f"Couldn't build schema for {use}: {e}")
+            # Don't bother re-building a schema for a type we know we can't handle.
+            failed = use in self._failed
+            if not failed:
+                try:
+                    schema = self.build_schema(use, name=self.defname(use, name=name))
+                except (ValueError, TypeError) as e:
+                    warnings.warn(f"Couldn't build schema for {use}: {e}")
+                    self._bounded_set(self._failed, use, None)
+                    failed = True
+            if failed:
                 schema = UndeclaredSchemaField(
                     enum=enum_,
                     title=self.defname(use, name=name),
@@ -241,18 +367,15 @@ class SchemaBuilder:
                     writeOnly=wo,
                 )
 
-        self.__cache[anno] = schema
-        self.__stack.clear()
         return schema
 
-    @staticmethod
     def _flatten_object_definitions(
-        definitions: Dict[str, Any], field: ObjectSchemaField
+        self, definitions: Dict[str, Any], field: ObjectSchemaField
     ):
         definitions.update(**(field.definitions or {}))  # type: ignore
-        field = dataclasses.replace(field, definitions=None)
+        field = field._replace(definitions=None)
         definitions[field.title] = field  # type: ignore
-        return Ref(f"#/definitions/{field.title}")
+        return self._ref(field.title)
 
     def _flatten_array_definitions(
         self, definitions: Dict[str, Any], field: ArraySchemaField
@@ -260,10 +383,10 @@ class SchemaBuilder:
         replace = {}
         for field_name in ("items", "contains", "additionalItems"):
             it = getattr(field, field_name)
-            if isinstance(it, (ObjectSchemaField, ArraySchemaField, MultiSchemaField)):
+            if isinstance(it, _NESTED):
                 ref = self._flatten_definitions(definitions, it)
                 replace[field_name] = ref
-        return dataclasses.replace(field, **replace) if replace else field
+        return field._replace(**replace) if replace else field
 
     def _flatten_multi_definitions(
         self, definitions: Dict[str, Any], field: MultiSchemaField
@@ -271,13 +394,11 @@ class SchemaBuilder:
         replace = {}
         for field_name in ("anyOf", "allOf", "oneOf"):
             it = getattr(field, field_name)
-            if it:
-                flattened = []
-                for f in it:
-                    nf = self._flatten_definitions(definitions, f)
-                    flattened.append(nf)
-                replace[field_name] = (*flattened,)
-        return dataclasses.replace(field, **replace) if replace else field
+            if it and any(isinstance(f, _NESTED) for f in it):
+                replace[field_name] = (
+                    *(self._flatten_definitions(definitions, f) for f in it),
+                )
+        return field._replace(**replace) if replace else field
 
     def _flatten_definitions(self, definitions: Dict[str, Any], field: SchemaFieldT):
         if isinstance(field, ObjectSchemaField):
@@ -288,9 +409,18 @@ class SchemaBuilder:
             return self._flatten_multi_definitions(definitions, field)
         return field
 
-    @staticmethod
-    def defname(obj, name: str = None) -> Optional[str]:
+    def defname(self, obj, name: str = None) -> Optional[str]:
         """Get the definition name for an object."""
+        key = (id(obj), name)
+        # Hold a reference to `obj` so its id can't be recycled.
+        entry: Any = self._defname_cache.get(key, _MISS)
+        if entry is _MISS:
+            entry = (obj, self._compute_defname(obj, name))
+            self._bounded_set(self._defname_cache, key, entry)
+        return entry[1]
+
+    @staticmethod
+    def _compute_defname(obj, name: str = None) -> Optional[str]:
         defname = name or getattr(obj, "__name__", None)
         if (obj is dict or origin(obj) is dict) and name:
             defname = name
@@ -298,26 +428,30 @@ class SchemaBuilder:
 
     def build_schema(self, obj: Type, *, name: str = None) -> "ObjectSchemaField":
         """Build a valid JSON Schema, including nested schemas."""
-        if obj in self.__cache:  # pragma: nocover
-            return self.__cache[obj]
+        entry = self.__cache.get(id(obj))
+        if entry is not None:  # pragma: nocover
+            return cast(ObjectSchemaField, entry[1])
 
         protocols: Dict[str, SerdeProtocol] = resolver.protocols(obj)
         definitions: Dict[str, Any] = {}
         properties: Dict[str, Any] = {}
         required: List[str] = []
         total: bool = getattr(obj, "__total__", True)
+        self_ref = self._ref(self.defname(obj))
+        get_field = self.get_field
         for nm, protocol in protocols.items():
-            if protocol.annotation.resolved_origin is obj:
-                flattened = Ref(f"#/definitions/{self.defname(obj)}")
+            anno = protocol.annotation
+            if anno.resolved_origin is obj:
+                properties[nm] = self_ref
             else:
-                ro = protocol.annotation.is_class_var or None
-                field = self.get_field(protocol, name=nm, parent=obj, ro=ro)
+                field = get_field(
+                    protocol, name=nm, parent=obj, ro=anno.is_class_var or None
+                )
                 # If we received an object schema,
                 # figure out a name and inherit the definitions.
-                flattened = self._flatten_definitions(definitions, field)
-            properties[nm] = flattened
+                properties[nm] = self._flatten_definitions(definitions, field)
             # Check for required field(s)
-            if not protocol.annotation.has_default:
+            if not anno.has_default:
                 required.append(nm)
         schema = ObjectSchemaField(
             title=name or self.defname(obj),
@@ -327,7 +461,7 @@ class SchemaBuilder:
             required=(*required,) if total else (),
             definitions=FrozenDict(definitions),
         )
-        self.__cache[obj] = schema
+        self._cache(id(obj), (obj, schema))
         return schema
 
     def all(self, primitive: bool = False) -> SchemaDefinitions:
@@ -363,25 +497,30 @@ class SchemaBuilder:
         """
         definitions = SchemaDefinitions(definitions={})
         schm: ObjectSchemaField
-        while self.__attached:
-            self.build_schema(self.__attached.pop())
-        for obj, schm in self.__cache.items():
-            if schm.type != SchemaType.OBJ:
+        attached = (*self.__attached,)
+        self.__attached.clear()
+        for t in attached:
+            self.build_schema(t)
+        for obj, field in self.__cache.values():
+            if field.type != SchemaType.OBJ:  # type: ignore
                 continue
+            schm = cast(ObjectSchemaField, field)
             definitions["definitions"].update(
                 {
-                    x: dataclasses.replace(y, definitions=None)
+                    x: y._replace(definitions=None)
                     for x, y in (schm.definitions or {}).items()
                 }
             )
             definitions["definitions"][
                 schm.title  # type: ignore
-            ] = dataclasses.replace(schm, definitions=None)
+            ] = schm._replace(
+                definitions=None
+            )
         if primitive:
-            definitions["definitions"] = {
-                x: y.primitive() if isinstance(y, ObjectSchemaField) else y
-                for x, y in definitions["definitions"].items()
-            }
+            defs = definitions["definitions"]
+            for x, y in defs.items():
+                if isinstance(y, ObjectSchemaField):
+                    defs[x] = y.primitive()
         return definitions
 
 
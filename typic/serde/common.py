@@ -18,6 +18,7 @@ from typing import (
     TypeVar,
     AnyStr,
     Iterator,
+    Collection,
     TYPE_CHECKING,
 )
 
@@ -80,6 +81,11 @@ class SerdeFlags:
     """
     exclude: Optional[Iterable[str]] = None
     """Provide a set of fields which will be excluded from the output."""
+    type_checking: bool = True
+    """Check the type of the input on serialization.
+
+    Disable this if the input is already known to be the correct type.
+    """
 
     def __init__(
         self,
@@ -88,17 +94,20 @@ class SerdeFlags:
         omit: OmitSettingsT = None,
         fields: FieldSettingsT = None,
         exclude: Iterable[str] = None,
+        type_checking: bool = True,
     ):
         self.signature_only = signature_only
         self.case = case
         self.omit = freeze(omit)  # type: ignore
         self.fields = cast(FieldSettingsT, freeze(fields))
         self.exclude = cast(Iterable[str], freeze(exclude))
+        self.type_checking = type_checking
 
     def merge(self, other: "SerdeFlags") -> "SerdeFlags":
         """Merge the values of another SerdeFlags instance into this one."""
         case = other.case or self.case
         signature_only = self.signature_only or other.signature_only
+        type_checking = self.type_checking and other.type_checking
         if other.omit and self.omit:
             omit = (*self.omit, *(o for o in other.omit if o not in self.omit))
         else:
@@ -123,6 +132,7 @@ class SerdeFlags:
             omit=omit,
             fields=fields,
             exclude=exclude,
+            type_checking=type_checking,
         )
 
 
@@ -149,6 +159,26 @@ class SerdeConfig:
     def __hash__(self):
         return hash(f"{self}")
 
+    @util.cached_property
+    def omit_set(self) -> Collection[Any]:
+        """The omit values in a container with the fastest membership check possible.
+
+        Values are collected in a frozenset, falling back to a tuple if any are
+        unhashable.
+        """
+        try:
+            return frozenset(self.omit_values)
+        except TypeError:
+            return (*self.omit_values,)
+
+    @util.cached_property
+    def fields_getters_out(self) -> Mapping[str, Callable[[str], Any]]:
+        """The field getters, keyed by the output name of each field."""
+        if self.fields_out:
+            getters = self.fields_getters
+            return {y: getters[x] for x, y in self.fields_out.items()}
+        return self.fields_getters
+
     def asdict(self) -> SerdeConfigD:
         return SerdeConfigD(
             fields=self.fields,
@@ -199,6 +229,10 @@ class Annotation:
     is_class_var: bool = dataclasses.field(init=False)
     resolved_origin: Type = dataclasses.field(init=False)
     args: Tuple[Type, ...] = dataclasses.field(init=False)
+    origin_parent: Type = dataclasses.field(init=False, compare=False)
+    """The builtin parent of :py:attr:`origin`, if it is a constrained type."""
+    resolved_parent: Type = dataclasses.field(init=False, compare=False)
+    """The builtin parent of :py:attr:`resolved_origin`, if it is a constrained type."""
 
     def __post_init__(self):
         self.has_default = self.parameter.default is not self.EMPTY
@@ -206,6 +240,10 @@ class Annotation:
         self.resolved_origin = util.origin(self.resolved)
         self.generic = getattr(self.resolved, "__origin__", self.resolved_origin)
         self.is_class_var = isclassvartype(self.un_resolved)
+        self.origin_parent = getattr(self.origin, "__parent__", self.origin)
+        self.resolved_parent = getattr(
+            self.resolved_origin, "__parent__", self.resolved_origin
+        )
 
 
 _empty = object()
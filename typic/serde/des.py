@@ -567,7 +567,7 @@ class DesFactory:
         anno_name = get_unique_name(origin)
         ns = {
             anno_name: origin,
-            "parent": getattr(origin, "__parent__", origin),
+            "parent": annotation.resolved_parent,
             "issubclass": cached_issubclass,
             **annotation.serde.asdict(),
         }
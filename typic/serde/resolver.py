@@ -272,6 +272,12 @@ class Resolver:
         encoding, which can result in massive performance gains over the standard `json`
         library.
 
+        If `orjson` is installed, it may be used instead by setting `TYPIC_ORJSON=1`
+        in the environment. Values orjson can't encode (e.g., integers wider than 64
+        bits) fall back to the default encoder. Note that orjson writes `NaN` and
+        `Infinity` as `null`, and that its output is formatted differently: it is
+        always compact, so it won't match the default encoder byte-for-byte.
+
         Examples
         --------
         >>> import typic
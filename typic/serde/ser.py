@@ -27,25 +27,18 @@ from typing import (
     TypeVar,
     Iterable,
     MutableMapping,
-    ItemsView,
-    KeysView,
-    ValuesView,
     Dict,
     Optional,
+    Tuple,
 )
 
 from typic import util, checks, gen, types
-from typic.ext import json
 from typic.common import DEFAULT_ENCODING
 from .common import (
     SerializerT,
     SerdeConfig,
     Annotation,
     ForwardDelayedAnnotation,
-    Unprocessed,
-    Omit,
-    KT,
-    VT,
     DelayedAnnotation,
     AnnotationT,
 )
@@ -61,73 +54,19 @@ _T = TypeVar("_T")
 def make_class_serdict(annotation: "Annotation", fields: Mapping[str, SerializerT]):
     name = f"{util.get_name(annotation.resolved_origin)}SerDict"
     bases = (ClassFieldSerDict,)
-    getters = annotation.serde.fields_getters
-    omit = (*annotation.serde.omit_values,)
+    getters = annotation.serde.fields_getters_out
     if annotation.serde.fields_out:
-        fout = annotation.serde.fields_out
-        getters = {y: getters[x] for x, y in fout.items()}
-        fields = {y: fields[x] for x, y in fout.items()}
+        fields = {y: fields[x] for x, y in annotation.serde.fields_out.items()}
 
-    def getitem(self, key):
-        v = dict.__getitem__(self, key)
-        return self.__missing__(key) if v is Unprocessed else v
-
-    if omit:
-
-        def missing(
-            self,
-            item,
-            *,
-            __fields=fields,
-            __getters=getters,
-            __repr=util.joinedrepr,
-            __omit=omit,
-        ):
-            raw = __getters[item](self.instance)
-            if raw not in __omit:
-                self[item] = ret = __fields[item](
-                    raw, lazy=self.lazy, name=__repr(self._name, item)
-                )
-                return ret
-            return Omit
-
-        def iter(self, *, __fields=fields.keys(), Omit=Omit):
-            for k in fields:
-                v = self.__missing__(k)
-                if v is Omit:
-                    continue
-                yield k
-
-    else:
-
-        def missing(  # type: ignore
-            self, item, *, __fields=fields, __getters=getters, __repr=util.joinedrepr,
-        ):
-            self[item] = ret = __fields[item](
-                __getters[item](self.instance),
-                lazy=self.lazy,
-                name=__repr(self._name, item),
-            )
-            return ret
-
-        def iter(self, *, __fields=fields.keys()):  # type: ignore
-            for k in __fields:
-                self.__missing__(k)
-                yield k
-
-    stdlib = json.using_stdlib()
     ns = dict(
         lazy=False,
         getters=getters,
         fields=fields,
-        omit=(*annotation.serde.omit_values,),
+        field_specs=tuple((k, getters[k], fields[k]) for k in getters),
+        omit=annotation.serde.omit_set,
         type=annotation.resolved_origin,
-        __missing__=missing,
-        __iter__=iter,
-        stdlib=stdlib,
+        __slots__=(),
     )
-    if stdlib:
-        ns["__getitem__"] = getitem
     return type(name, bases, ns)
 
 
@@ -136,142 +75,100 @@ class SerializationValueError(ValueError):
 
 
 class ClassFieldSerDict(dict):
+    """A dict of the serialized fields of a class instance.
+
+    All fields are serialized when the dict is created, so iteration, lookup
+    and copying all use the builtin dict implementation.
+    """
+
     type: Type
-    instance: Any
     lazy: bool
     getters: Mapping[str, Callable[[str], Any]]
     fields: Mapping[str, SerializerT]
-    omit: Iterable[Any]
-    stdlib: bool
+    field_specs: Tuple[Tuple[str, Callable[[Any], Any], SerializerT], ...]
+    omit: Collection[Any]
 
-    __slots__ = ("instance", "lazy", "_name")
+    __slots__ = ()
 
     def __init__(
         self, instance: Any, lazy: bool = False, *, __tfname__: util.ReprT = None,
     ):
-        self._name = __tfname__
-        self.instance = instance
-        self.lazy = lazy
-        if self.stdlib:
-            dict.__init__(self, dict.fromkeys(self.fields, Unprocessed))
-
-    def __hash__(self):
-        return self.instance.__hash__()
-
-    def items(self) -> ItemsView[KT, VT]:  # pragma: nocover
-        return ItemsView(self)  # type: ignore
-
-    def keys(self) -> KeysView[KT]:  # pragma: nocover
-        return KeysView(self)  # type: ignore
-
-    def values(self) -> ValuesView[VT]:  # pragma: nocover
-        return ValuesView(self)  # type: ignore
+        dict.__init__(self)
+        self.fill(self, instance, lazy=lazy, name=__tfname__)
+
+    @classmethod
+    def fill(
+        cls, d: dict, instance: Any, *, lazy: bool = False, name: util.ReprT = None
+    ) -> dict:
+        """Write the serialized fields of `instance` into the dict `d`."""
+        omit, setitem, repr_ = cls.omit, dict.__setitem__, util.joinedrepr
+        for k, getter, ser in cls.field_specs:
+            raw = getter(instance)
+            if omit:
+                try:
+                    if raw in omit:
+                        continue
+                # An unhashable value can't be in a frozenset of omit values.
+                except TypeError:
+                    pass
+            setitem(d, k, ser(raw, lazy=lazy, name=repr_(name, k)))  # type: ignore
+        return d
 
 
 def make_kv_serdict(annotation: "Annotation", kser: SerializerT, vser: SerializerT):
     name = f"{util.get_name(annotation.resolved_origin)}KVSerDict"
     bases = (KVSerDict,)
-    omit = (*annotation.serde.omit_values,)
-
-    def getitem(self, key):
-        v = dict.__getitem__(self, key)
-        return self.__missing__(key) if v is Unprocessed else v
-
-    if omit:
-
-        def missing(self, key, *, __repr=util.collectionrepr, __vser=vser, __omit=omit):
-            if key in self._unprocessed:
-                value = self._unprocessed[key]
-                if value in __omit:
-                    return Omit
-                newv = __vser(  # type: ignore
-                    value, lazy=self.lazy, name=__repr(self._name, key),
-                )
-                self[key] = newv
-                return newv
-            raise KeyError(f"{__repr(self._name, key)!r}")
-
-        def iter(self, *, Omit=Omit, __kser=kser):  # type: ignore
-            for k in self._unprocessed:
-                if self[k] is Omit:
-                    continue
-                yield k
-
-    else:
-
-        def missing(self, key, *, __repr=util.collectionrepr, __vser=vser):  # type: ignore
-            if key in self._unprocessed:
-                newv = vser(  # type: ignore
-                    self._unprocessed[key],
-                    lazy=self.lazy,
-                    name=__repr(self._name, key),
-                )
-                self[key] = newv
-                return newv
-            raise KeyError(f"{__repr(self._name, key)!r}")
-
-        def iter(self, *, __kser=kser):  # type: ignore
-            for k in self._unprocessed:
-                self[k]
-                yield k
-
-    stdlib = json.using_stdlib()
     ns = dict(
         type=annotation.generic,
         lazy=False,
         kser=staticmethod(kser),
         vser=staticmethod(vser),
-        omit=omit,
-        __missing__=missing,
-        __iter__=iter,
-        stdlib=stdlib,
+        omit=annotation.serde.omit_set,
+        __slots__=(),
     )
-    if stdlib:
-        ns["__getitem__"] = getitem
     return type(name, bases, ns)
 
 
 class KVSerDict(dict):
+    """A dict of the serialized keys and values of a mapping.
+
+    All entries are serialized when the dict is created.
+    """
+
     kser: SerializerT
     vser: SerializerT
     lazy: bool
-    omit: Iterable[Any]
-    stdlib: bool
+    omit: Collection[Any]
 
-    __slots__ = ("_unprocessed", "_name")
+    __slots__ = ()
 
     def __init__(self, mapping: Mapping, *, lazy: bool = False, __tfname__: util.ReprT):
-        kser = self.kser
-        self._name = __tfname__
-        self._unprocessed = {kser(k): v for k, v in mapping.items()}  # type: ignore
-        self.lazy = lazy
-        if self.stdlib:
-            dict.__init__(self, dict.fromkeys(self._unprocessed, Unprocessed))
-
-    def items(self) -> ItemsView[KT, VT]:  # pragma: nocover
-        return ItemsView(self)  # type: ignore
-
-    def keys(self) -> KeysView[KT]:
-        return KeysView(self)  # type: ignore
-
-    def values(self) -> ValuesView[VT]:  # pragma: nocover
-        return ValuesView(self)  # type: ignore
+        dict.__init__(self)
+        kser, vser, omit = self.kser, self.vser, self.omit
+        setitem, repr_ = dict.__setitem__, util.collectionrepr
+        for k, v in mapping.items():
+            if omit:
+                try:
+                    if v in omit:
+                        continue
+                except TypeError:
+                    pass
+            k = kser(k)  # type: ignore
+            setitem(self, k, vser(v, lazy=lazy, name=repr_(__tfname__, k)))  # type: ignore
 
 
 def make_serlist(annotation: "Annotation", serializer: SerializerT):
     name = f"{util.get_name(annotation.resolved_origin)}SerList"
     bases = (SerList,)
     ns = dict(
-        lazy=False,
-        serializer=staticmethod(serializer),
-        omit=(*annotation.serde.omit_values,),
+        lazy=False, serializer=staticmethod(serializer), omit=annotation.serde.omit_set,
     )
     return type(name, bases, ns)
 
 
 class SerList(list):
     serializer: SerializerT
-    omit: Iterable[Any]
+    omit: Collection[Any]
     lazy: bool
 
     __slots__ = ("repr", "_name")
@@ -280,13 +177,14 @@ class SerList(list):
         self.repr = util.collectionrepr
         self.lazy = lazy
         self._name = __tfname__
-        ser = self.serializer
+        ser, repr_ = self.serializer, util.collectionrepr
+        # A comprehension runs in a single frame, unlike feeding a generator.
         list.__init__(
             self,
-            (
-                ser(x, lazy=lazy, name=self.repr(self._name, i))  # type: ignore
+            [
+                ser(x, lazy=lazy, name=repr_(__tfname__, i))  # type: ignore
                 for i, x in enumerate(seq)
-            ),
+            ],
         )
 
     def __setitem__(self, key, value):  # pragma: nocover
@@ -303,15 +201,28 @@ class SerList(list):
         )
 
 
-def _iso(o) -> str:
-    if isinstance(o, (datetime.datetime, datetime.time)) and not o.tzinfo:
+def _iso(o: Union[datetime.datetime, datetime.time]) -> str:
+    # Naive datetimes and times are assumed to be UTC.
+    if o.tzinfo is None:
         return f"{o.isoformat()}+00:00"
     return o.isoformat()
 
 
+def _iso_date(o: datetime.date) -> str:
+    # A datetime is also a date, but it keeps its time and offset.
+    if isinstance(o, datetime.datetime):
+        return _iso(o)
+    return o.isoformat()
+
+
 _decode = methodcaller("decode", DEFAULT_ENCODING)
 _total_secs = methodcaller("total_seconds")
 _pattern = attrgetter("pattern")
+_secret = attrgetter("secret")
+
+
+def _decode_secret(o) -> str:
+    return _decode(o.secret)
 
 
 class SerFactory:
@@ -338,19 +249,28 @@ class SerFactory:
         types.HostName: str,
         types.NetworkAddress: str,
         types.RelativeURL: str,
-        types.SecretBytes: lambda o: _decode(o.secret),
-        types.SecretStr: attrgetter("secret"),
+        types.SecretBytes: _decode_secret,
+        types.SecretStr: _secret,
         types.URL: str,
         uuid.UUID: str,
         decimal.Decimal: float,
         bytes: _decode,
         bytearray: _decode,
-        datetime.date: _iso,
+        datetime.date: _iso_date,
         datetime.datetime: _iso,
         datetime.time: _iso,
         datetime.timedelta: _total_secs,
     }
 
+    # Defined serializers which can be written directly into the generated code.
+    _INLINE: Mapping[Callable[[Any], Any], str] = {
+        _decode: f"o.decode({DEFAULT_ENCODING!r})",
+        _decode_secret: f"o.secret.decode({DEFAULT_ENCODING!r})",
+        _pattern: "o.pattern",
+        _secret: "o.secret",
+        _total_secs: "o.total_seconds()",
+    }
+
     _LISTITER = (
         list,
         tuple,
@@ -362,41 +282,58 @@ class SerFactory:
         Iterable_abc,
     )
     _DICTITER = (dict, Mapping, Mapping_abc, MappingProxyType, types.FrozenDict)
+    _DEFINED_TYPES = (*_DEFINED,)
     _PRIMITIVES = (str, int, bool, float, type(None), type(...))
+    _PRIMITIVES_SET = frozenset(_PRIMITIVES)
+    _IDENTITY = frozenset((str, int, bool, float))
     _DYNAMIC = frozenset(
         {Union, Any, inspect.Parameter.empty, dataclasses.MISSING, ClassVar}
     )
     _FNAME = "fname"
+    _UNROLL_MAX_FIELDS = 64
 
     def __init__(self, resolver: "Resolver"):
         self.resolver = resolver
         self._serializer_cache: MutableMapping[str, SerializerT] = {}
+        # Keyed by the annotation's id, holding the annotation to pin that id.
+        self._serializer_cache_by_id: Dict[int, Tuple["Annotation", SerializerT]] = {}
 
     @staticmethod
     def _get_name(annotation: "Annotation") -> str:
         return util.get_defname("serializer", annotation)
 
-    def _check_add_null_check(self, func: gen.Block, annotation: "Annotation"):
+    def _add_checks(
+        self, func: gen.Block, annotation: "Annotation", *, bind_name: bool = True
+    ):
+        """Write the null-check and type-check for the input of a serializer.
+
+        If `bind_name` is False, the display name is only built for the error.
+        """
+        resolved_name = util.get_name(annotation.resolved)
+        name_line = f"{self._FNAME} = name or {resolved_name!r}"
         if annotation.optional:
             with func.b(f"if o in {self.resolver.OPTIONALS}:") as b:
                 b.l(f"{gen.Keyword.RET}")
-
-    def _add_type_check(self, func: gen.Block, annotation: "Annotation"):
-        resolved_name = util.get_name(annotation.resolved)
-        func.l(f"{self._FNAME} = name or {resolved_name!r}")
-        line = "if not tcheck(o.__class__, t):"
+        if bind_name:
+            func.l(name_line)
+        if not annotation.serde.flags.type_checking:
+            return
+        # An exact match is the common case, so check identity before subclassing.
+        line = "if o.__class__ is not t and not tcheck(o.__class__, t):"
         check: Callable[[Any], bool] = util.cached_issubclass
         if checks.isbuiltinsubtype(annotation.generic):
-            line = "if not tcheck(o, t):"
+            line = "if o.__class__ is not t and not tcheck(o, t):"
             check = isinstance  # type: ignore
         with func.b(line, tcheck=check) as b:
+            qualname = util.get_qualname(annotation.generic)
             msg = (
                 f"{{{self._FNAME}}}: type {{inst_tname!r}} "
-                f"is not a subtype of type "
-                f"{util.get_qualname(annotation.generic)!r}. "
+                f"is not a subtype of type {qualname!r}. "
                 f"Perhaps this annotation should be "
-                f"Union[{{inst_tname}}, {util.get_qualname(annotation.generic)}]?"
+                f"Union[{{inst_tname}}, {qualname}]?"
             )
+            if not bind_name:
+                b.l(name_line)
             b.l("inst_tname = qualname(o.__class__)")
             b.l(
                 f"raise err(f{msg!r})",
@@ -405,6 +342,14 @@ class SerFactory:
                 t=annotation.generic,
             )
 
+    def _is_identity_serializer(self, annotation: "AnnotationT") -> bool:
+        return (
+            isinstance(annotation, Annotation)
+            and annotation.resolved_origin in self._IDENTITY
+            and not annotation.optional
+            and not annotation.serde.flags.type_checking
+        )
+
     def _build_list_serializer(
         self, func: gen.Block, annotation: "Annotation",
     ):
@@ -416,16 +361,18 @@ class SerFactory:
                 annotation.args[0], flags=annotation.serde.flags
             )
             arg_ser = self.factory(arg_a)
-            arg_ser_name = "arg_ser"
+            # Unchecked, non-null primitives are serialized as-is,
+            # so we can skip the per-item call entirely.
+            if not self._is_identity_serializer(arg_a):
+                arg_ser_name = "arg_ser"
 
-            serlist = make_serlist(annotation, arg_ser)
-            serlist_name = serlist.__name__
+                serlist = make_serlist(annotation, arg_ser)
+                serlist_name = serlist.__name__
 
-            ns = {serlist_name: serlist, arg_ser_name: arg_ser}
-            line = f"{serlist_name}(o, lazy=lazy, __tfname__={self._FNAME})"
+                ns = {serlist_name: serlist, arg_ser_name: arg_ser}
+                line = f"{serlist_name}(o, lazy=lazy, __tfname__={self._FNAME})"
 
-        self._check_add_null_check(func, annotation)
-        self._add_type_check(func, annotation)
+        self._add_checks(func, annotation)
         func.l(f"{gen.Keyword.RET} {line}", level=None, **ns)
 
     def _build_key_serializer(
@@ -458,18 +405,16 @@ class SerFactory:
         self, func: gen.Block, serdict: Type, annotation: "Annotation",
     ):
         serdict_name = serdict.__name__
-        self._check_add_null_check(func, annotation)
-        self._add_type_check(func, annotation)
+        self._add_checks(func, annotation)
 
         ns: Dict[str, Any] = {serdict_name: serdict}
-        func.l(
-            f"d = {serdict_name}(o, lazy=lazy, __tfname__={self._FNAME})",
-            level=None,
-            **ns,
-        )
-        # Write the line.
-        line = "d if lazy else {**d}"
-        func.l(f"{gen.Keyword.RET} {line}")
+        with func.b("if lazy:", **ns) as b:
+            b.l(
+                f"{gen.Keyword.RET} "
+                f"{serdict_name}(o, lazy=lazy, __tfname__={self._FNAME})"
+            )
+        # Fill a plain dict directly rather than copying the SerDict.
+        func.l(f"{gen.Keyword.RET} {serdict_name}.fill({{}}, o, name={self._FNAME})")
 
     def _build_dict_serializer(self, func: gen.Block, annotation: "Annotation"):
         # Check for args
@@ -490,8 +435,33 @@ class SerFactory:
         # Get the names for our important variables
 
         serdict = make_kv_serdict(annotation, kser_, vser_)
-
-        self._finalize_mapping_serializer(func, serdict, annotation)
+        serdict_name = serdict.__name__
+        self._add_checks(func, annotation)
+        with func.b("if lazy:", **{serdict_name: serdict}) as b:
+            b.l(f"{gen.Keyword.RET} {serdict_name}(o, lazy=lazy, __tfname__=fname)")
+        # Otherwise, build the output in a single pass.
+        ns: Dict[str, Any] = dict(
+            kser=kser_, vser=vser_, collectionrepr=util.collectionrepr
+        )
+        if not serdict.omit:
+            func.l(
+                f"{gen.Keyword.RET} "
+                "{sk: vser(v, lazy=False, name=collectionrepr(fname, sk)) "
+                "for k, v in o.items() for sk in (kser(k),)}",
+                **ns,
+            )
+            return
+        func.l("d = {}", **ns)
+        with func.b("for k, v in o.items():") as loop:
+            # An unhashable value can't be in a frozenset of omit values.
+            with loop.b("try:", omit=serdict.omit) as b:
+                with b.b("if v in omit:") as bb:
+                    bb.l("continue")
+            with loop.b("except TypeError:") as b:
+                b.l("pass")
+            loop.l("k = kser(k)")
+            loop.l("d[k] = vser(v, lazy=False, name=collectionrepr(fname, k))")
+        func.l(f"{gen.Keyword.RET} d")
 
     def _build_class_serializer(
         self, func: gen.Block, annotation: "Annotation",
@@ -500,15 +470,50 @@ class SerFactory:
         fields_ser = {x: self.factory(y) for x, y in annotation.serde.fields.items()}
 
         serdict = make_class_serdict(annotation, fields_ser)
+        # Very wide classes aren't worth unrolling.
+        if len(fields_ser) > self._UNROLL_MAX_FIELDS:
+            self._finalize_mapping_serializer(func, serdict, annotation)
+            return
 
-        self._finalize_mapping_serializer(func, serdict, annotation)
+        serdict_name = serdict.__name__
+        self._add_checks(func, annotation)
+        # The lazy path still hands back the SerDict...
+        with func.b("if lazy:", **{serdict_name: serdict}) as b:
+            b.l(f"{gen.Keyword.RET} {serdict_name}(o, lazy=lazy, __tfname__=fname)")
+        # ...but otherwise we write out each field directly.
+        func.l("d = {}", joinedrepr=util.joinedrepr)
+        omit = serdict.omit
+        default_name = util.get_name(annotation.resolved)
+        for i, (out, getter) in enumerate(serdict.getters.items()):
+            getter_name, ser_name = f"getter_{i}", f"ser_{i}"
+            # Field names under the default root name can be built ahead of time.
+            name_name = f"name_{i}"
+            ns = {getter_name: getter, name_name: util.joinedrepr(default_name, out)}
+            func.l(f"v = {getter_name}(o)", **ns)
+            line = (
+                f"d[{out!r}] = {ser_name}(v, lazy=False, name={name_name} "
+                f"if name is None else joinedrepr({self._FNAME}, {out!r}))"
+            )
+            if not omit:
+                func.l(line, **{ser_name: serdict.fields[out]})
+                continue
+            # An unhashable value can't be in a frozenset of omit values.
+            with func.b("try:", omit=omit) as b:
+                b.l("keep = v not in omit")
+            with func.b("except TypeError:") as b:
+                b.l("keep = True")
+            with func.b("if keep:", **{ser_name: serdict.fields[out]}) as b:
+                b.l(line)
+        func.l(f"{gen.Keyword.RET} d")
 
     def _compile_enum_serializer(self, annotation: "Annotation") -> SerializerT:
         origin: Type[enum.Enum] = cast(Type[enum.Enum], annotation.resolved_origin)
         ts = {type(x.value) for x in origin}
+        # Default to lazy serialization for mixed value types.
+        fallback: SerializerT = self.resolver.primitive
         # If we can predict a single type the return the serializer for that
         if len(ts) == 1:
-            t = ts.pop()
+            t = next(iter(ts))
             va = self.resolver.annotation(t, flags=annotation.serde.flags)
             vser = self.factory(va)
 
@@ -517,9 +522,35 @@ class SerFactory:
             ):
                 return _vser(o.value, lazy=lazy, name=name)
 
-            return serializer
-        # Else default to lazy serialization
-        return self.resolver.primitive
+            fallback = serializer
+        # Primitive values are immutable, so we can serialize every member up-front.
+        if ts <= self._PRIMITIVES_SET:
+            flags = annotation.serde.flags
+            members: Dict[Optional[enum.Enum], Any] = {
+                m: self.factory(self.resolver.annotation(type(m.value), flags=flags))(
+                    m.value
+                )
+                for m in origin
+            }
+            if annotation.optional:
+                members[None] = None
+
+            def precomputed_serializer(
+                o: enum.Enum,
+                *,
+                lazy: bool = False,
+                name: util.ReprT = None,
+                _members=members,
+                _default=fallback,
+            ):
+                try:
+                    return _members[o]
+                # Not a member (or not hashable), so take the long way.
+                except (KeyError, TypeError):
+                    return _default(o, lazy=lazy, name=name)
+
+            return precomputed_serializer
+        return fallback
 
     def _compile_defined_serializer(
         self, annotation: "Annotation", ser: SerializerT,
@@ -534,9 +565,8 @@ class SerFactory:
                 main.param("lazy", default=False),
                 main.param("name", default=None),
             ) as func:
-                self._check_add_null_check(func, annotation)
-                self._add_type_check(func, annotation)
-                line = f"{ser_name}(o)"
+                self._add_checks(func, annotation, bind_name=False)
+                line = self._INLINE.get(ser) or f"{ser_name}(o)"  # type: ignore
                 if annotation.origin in (type(o) for o in self.resolver.OPTIONALS):
                     line = "None"
                 func.l(f"{gen.Keyword.RET} {line}")
@@ -547,20 +577,31 @@ class SerFactory:
     def _compile_defined_subclass_serializer(
         self, origin: Type, annotation: "Annotation"
     ):
-        for t, s in self._DEFINED.items():
-            if issubclass(origin, t):
-                return self._compile_defined_serializer(annotation, s)
+        # Walk the MRO so the nearest defined base wins.
+        for base in origin.__mro__:
+            if base in self._DEFINED:
+                return self._compile_defined_serializer(annotation, self._DEFINED[base])
         # pragma: nocover
 
     def _compile_primitive_subclass_serializer(
         self, origin: Type, annotation: "Annotation"
     ):
-        for t in self._PRIMITIVES:
-            if issubclass(origin, t):
-                return self._compile_defined_serializer(annotation, t)
+        for base in origin.__mro__:
+            if base in self._PRIMITIVES_SET:
+                return self._compile_defined_serializer(annotation, base)
         # pragma: nocover
 
     def _compile_serializer(self, annotation: "Annotation") -> SerializerT:
+        # Skip building the definition name if we've seen this exact annotation.
+        key = id(annotation)
+        entry = self._serializer_cache_by_id.get(key)
+        if entry is not None:
+            return entry[1]
+        serializer = self._build_serializer(annotation)
+        self._serializer_cache_by_id[key] = (annotation, serializer)
+        return serializer
+
+    def _build_serializer(self, annotation: "Annotation") -> SerializerT:
         # Check for an optional and extract the type if possible.
         func_name = self._get_name(annotation)
         # We've been here before...
@@ -586,8 +627,7 @@ class SerFactory:
                     main.param("lazy", default=False),
                     main.param("name", default=None),
                 ) as func:
-                    self._check_add_null_check(func, annotation)
-                    self._add_type_check(func, annotation)
+                    self._add_checks(func, annotation, bind_name=False)
                     line = "o"
                     if annotation.origin in (type(o) for o in self.resolver.OPTIONALS):
                         line = "None"
@@ -601,7 +641,7 @@ class SerFactory:
             serializer = self._compile_defined_serializer(
                 annotation, self._DEFINED[origin]
             )
-        elif issubclass(origin, (*self._DEFINED,)):
+        elif issubclass(origin, self._DEFINED_TYPES):
             serializer = self._compile_defined_subclass_serializer(origin, annotation)
         elif issubclass(origin, self._PRIMITIVES):
             serializer = self._compile_primitive_subclass_serializer(origin, annotation)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Internal helpers shared by the URL, DSN and Email types."""
+import re
+import string
+from typing import Dict, FrozenSet
+from urllib import parse
+
+from .secret import SecretStr
+
+
+# By no means an exhaustive list, but a decent chunk of use-cases
+DEFAULT_PORTS: Dict[str, FrozenSet[int]] = {
+    "http": frozenset({80}),
+    "https": frozenset({443}),
+    "ws": frozenset({80}),
+    "wss": frozenset({443}),
+    "smtp": frozenset({25}),
+    "ftp": frozenset({20, 21}),
+    "telnet": frozenset({23}),
+    "imap": frozenset({143}),
+    "rdp": frozenset({3389}),
+    "ssh": frozenset({22}),
+    "dns": frozenset({53}),
+    "dhcp": frozenset({67, 68}),
+    "pop3": frozenset({110}),
+    "mysql": frozenset({3306}),
+    "vertica": frozenset({5434}),
+    "postgresql": frozenset({5432}),
+}
+# The port assumed for each scheme when none is given.
+DEFAULT_PORT: Dict[str, int] = {
+    "http": 80,
+    "https": 443,
+    "ws": 80,
+    "wss": 443,
+    "smtp": 25,
+    "ftp": 21,
+    "telnet": 23,
+    "imap": 143,
+    "rdp": 3389,
+    "ssh": 22,
+    "dns": 53,
+    "dhcp": 67,
+    "pop3": 110,
+    "mysql": 3306,
+    "vertica": 5434,
+    "postgresql": 5432,
+}
+# The ports which count as the default for each scheme (0 is "not given").
+NO_PORT: FrozenSet[int] = frozenset({0})
+DEFAULT_PORT_SETS: Dict[str, FrozenSet[int]] = {
+    scheme: ports | NO_PORT for scheme, ports in DEFAULT_PORTS.items()
+}
+# The grammar of url.NET_ADDR_PATTERN, minus the groups no parser reads.
+SIMPLE_NET_ADDR_PATTERN = re.compile(
+    r"""
+    \A
+    # Scheme
+    (?:(?P<scheme>[a-z0-9.+-]*)://)?
+    # Auth
+    (?P<auth>(?P<username>[^:@]+?)[:@](?P<password>[^:@]*?)[:@])?
+    # Host
+    (?P<host>
+        # Domain
+        (?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z0-9-]{2,}\.?
+        # Dotless (or localhost)
+        |[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.?
+        # IPV4
+        |(?P<ipv4>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})
+        # IPV6
+        |(?P<ipv6>\[[A-F0-9]*:[A-F0-9:]+\])
+    )?
+    # Port
+    (?::(?P<port>\d+))?
+    # Path, Q-string & fragment
+    (?P<relative>/?|[/?#]\S+)
+    \Z
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+# Mirrors the characters which parse.quote() leaves as-is, with the default safe="/".
+_QUOTE_SAFE = frozenset(string.ascii_letters + string.digits + "_.-~/")
+_QUOTE_TABLE = {c: f"%{c:02X}" for c in range(128) if chr(c) not in _QUOTE_SAFE}
+
+
+def quote(value: str) -> str:
+    """A faster :py:func:`urllib.parse.quote` for the common case of ASCII input."""
+    if value.isascii():
+        return value.translate(_QUOTE_TABLE)
+    return parse.quote(value)
+
+
+# Most addresses have no password, so share one (immutable) empty secret.
+EMPTY_SECRET = SecretStr("")
+
+
+_INTERNAL_V4_PREFIXES = ("127.", "192.168.", "10.")
+_INTERNAL_V6_PREFIXES = ("fc", "fd")
+
+
+def is_internal_ip(host: str) -> bool:
+    """Whether the given IP address falls in a loopback or private range."""
+    host = host.lower().strip("[]")
+    if (
+        host == "::1"
+        or host.startswith(_INTERNAL_V4_PREFIXES)
+        or host.startswith(_INTERNAL_V6_PREFIXES)
+    ):
+        return True
+    if host.startswith("172."):
+        octet = host[4 : host.find(".", 4)]
+        return octet.isdigit() and 16 <= int(octet) <= 31
+    return False
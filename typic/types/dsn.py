@@ -2,15 +2,23 @@
 # -*- coding: UTF-8 -*-
 import dataclasses
 from types import MappingProxyType
-from typing import ClassVar, Pattern, Dict, Set, Match, Optional, Mapping, List
-from urllib.parse import urlencode, urlparse, ParseResult, quote, parse_qs
+from typing import ClassVar, Pattern, Dict, FrozenSet, Mapping, List
+from urllib.parse import urlencode, urlparse, ParseResult, parse_qs
 
 from typic.util import cached_property, slotted
+from ._netaddr import DEFAULT_PORTS  # noqa: F401
+from ._netaddr import (
+    DEFAULT_PORT,
+    DEFAULT_PORT_SETS,
+    EMPTY_SECRET,
+    NO_PORT,
+    SIMPLE_NET_ADDR_PATTERN,
+    is_internal_ip,
+    quote,
+)
 from .secret import SecretStr
 from .url import (
-    DEFAULT_PORTS,
     INTERNAL_HOSTS,
-    INTERNAL_IP_PATTERN,
     NetworkAddress,
     NET_ADDR_PATTERN,
     NetworkAddressValueError,
@@ -65,23 +73,25 @@ class DSNInfo:
     is_ip: bool = False
 
     PATTERN: ClassVar[Pattern] = NET_ADDR_PATTERN
-    DEFAULT_PORTS: ClassVar[Dict] = DEFAULT_PORTS
-    PRIVATE_HOSTS: ClassVar[Set[str]] = PRIVATE_HOSTS
-    INTERNAL_HOSTS: ClassVar[Set[str]] = INTERNAL_HOSTS
+    DEFAULT_PORTS: ClassVar[Dict[str, FrozenSet[int]]] = DEFAULT_PORTS  # noqa: F811
+    PRIVATE_HOSTS: ClassVar[FrozenSet[str]] = PRIVATE_HOSTS
+    INTERNAL_HOSTS: ClassVar[FrozenSet[str]] = INTERNAL_HOSTS
 
     @classmethod
     def from_str(cls, value) -> "DSNInfo":
         """Parse & validate a string and generate an instance of :py:class:`DSNInfo`."""
-        match: Optional[Match] = cls.PATTERN.match(value)
-        if not match or not value:
+        pattern = (
+            SIMPLE_NET_ADDR_PATTERN if cls.PATTERN is NET_ADDR_PATTERN else cls.PATTERN
+        )
+        match = pattern.fullmatch(value)
+        if not match:
             raise DSNValueError(f"{value!r} is not a valid DSN.")
         scheme, host = match["scheme"] or "", match["host"] or ""
         if not scheme or not host:
             raise DSNValueError(f"{value!r} is not a valid DSN, missing driver|host.")
 
-        port = int(match["port"] or 0)
-        if port == 0 and cls.DEFAULT_PORTS[scheme]:
-            port = cls.DEFAULT_PORTS[scheme].copy().pop()
+        password = match["password"]
+        port = int(match["port"] or 0) or DEFAULT_PORT.get(scheme, 0)
         if port == 0:
             raise DSNValueError(
                 f"{value!r} is not a valid DSN, couldn't determine port."
@@ -91,7 +101,7 @@ class DSNInfo:
             driver=scheme,
             host=host,
             username=match["username"] or "",
-            password=SecretStr(match["password"] or ""),
+            password=SecretStr(password) if password else EMPTY_SECRET,
             qs=parsed.query,
             port=port,
             name=parsed.path,
@@ -126,7 +136,7 @@ class DSNInfo:
     @cached_property
     def address_encoded(self) -> str:
         """The fully-qualified address, encoded."""
-        return quote(self.address)  # type: ignore
+        return quote(self.address)
 
     @cached_property
     def query(self) -> Mapping[str, List[str]]:
@@ -136,7 +146,7 @@ class DSNInfo:
     @cached_property
     def is_default_port(self) -> bool:
         """Whether or not the port is the default for the SQL dialect."""
-        defaults = DEFAULT_PORTS[self.driver.split("+")[0]] | {0}
+        defaults = DEFAULT_PORT_SETS.get(self.driver.split("+")[0], NO_PORT)
         return self.port in defaults
 
     @cached_property
@@ -151,8 +161,7 @@ class DSNInfo:
         Internal IP/DNS addresses aren't necessarily private, hence the distinction.
         """
         return bool(
-            self.host in INTERNAL_HOSTS
-            or (self.is_ip and INTERNAL_IP_PATTERN.match(self.host))
+            self.host in INTERNAL_HOSTS or (self.is_ip and is_internal_ip(self.host))
         )
 
 
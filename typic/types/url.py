@@ -1,13 +1,32 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import dataclasses
+import functools
 import re
-from collections import defaultdict
 from types import MappingProxyType
-from typing import Dict, List, ClassVar, Pattern, Match, Mapping, Set, Optional
+from typing import (
+    Dict,
+    List,
+    ClassVar,
+    Pattern,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    FrozenSet,
+)
 from urllib import parse
 
 from typic.util import cached_property, slotted
+from ._netaddr import DEFAULT_PORTS  # noqa: F401
+from ._netaddr import (
+    DEFAULT_PORT,
+    DEFAULT_PORT_SETS,
+    EMPTY_SECRET,
+    NO_PORT,
+    is_internal_ip,
+    quote,
+)
 from .secret import SecretStr
 
 __all__ = (
@@ -24,31 +43,9 @@ __all__ = (
 )
 
 
-# By no means an exhaustive list, but a decent chunk of use-cases
-DEFAULT_PORTS = defaultdict(
-    set,
-    {
-        "http": {80},
-        "https": {443},
-        "ws": {80},
-        "wss": {443},
-        "smtp": {25},
-        "ftp": {20, 21},
-        "telnet": {23},
-        "imap": {143},
-        "rdp": {3389},
-        "ssh": {25},
-        "dns": {53},
-        "dhcp": {67, 68},
-        "pop3": {110},
-        "mysql": {3306},
-        "vertica": {5434},
-        "postgresql": {5432},
-    },
-)
 NET_ADDR_PATTERN = re.compile(
     r"""
-    ^
+    \A
     (
         # Scheme
         ((?P<scheme>(?:[a-z0-9\.\-\+]*))://)?
@@ -74,28 +71,117 @@ NET_ADDR_PATTERN = re.compile(
     )?
     # Path, Q-string & fragment
     (?P<relative>(?:/?|[/?#]\S+))
-    $
+    \Z
     """,
     re.IGNORECASE | re.VERBOSE,
 )
-PRIVATE_HOSTS = {"localhost", "127.0.0.1"}
-INTERNAL_HOSTS = PRIVATE_HOSTS | {"0.0.0.0"}
-
-
-INTERNAL_IP_PATTERN = re.compile(
+_SCHEME_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-+"
+)
+_AUTH_SEP = re.compile(r"[:@]")
+_HOST_END = re.compile(r"[:/?#]")
+_RELATIVE_START = re.compile(r"[/?#]")
+_WHITESPACE = re.compile(r"\s")
+# A single, literal path segment (no dot-segments) with a leading `/`.
+_PATH_SEGMENT = re.compile(r"/(?!\.\.?\Z)[^/:?#;\s]+\Z")
+# Every label ends with a `.`, so matching a host never backtracks across labels.
+_HOST = re.compile(
     r"""
-    ^
-    # IPv4
-    (127\.)|
-    (192\.168\.)|
-    (10\.)|(172\.1[6-9]\.)|
-    (172\.2[0-9]\.)|(172\.3[0-1]\.)|
-    # IPv6
-    (::1)|([F][CD])
-    $
+    (?:
+        # Domain
+        (?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z0-9-]{2,}\.?
+        # Dotless (or localhost)
+        |[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.?
+        # IPV4
+        |\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}
+    )
+    \Z
     """,
-    re.I | re.VERBOSE,
+    re.IGNORECASE | re.VERBOSE,
 )
+_IPV4 = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\Z")
+_IPV6 = re.compile(r"\[[A-F0-9]*:[A-F0-9:]+\]\Z", re.IGNORECASE)
+
+_NetAddrPartsT = Tuple[str, str, str, str, str, str, bool]
+
+
+def _scan_host(value: str) -> Optional[Tuple[str, str, str, bool]]:
+    """Split the host, port, and relative portion off the end of a net-address."""
+    if value[:1] == "[":
+        end = value.find("]") + 1
+        host = value[:end]
+        if not end or not _IPV6.match(host):
+            return None
+        is_ip = True
+    else:
+        match = _HOST_END.search(value)
+        end = match.start() if match else len(value)
+        host = value[:end]
+        if host and not _HOST.match(host):
+            return None
+        is_ip = bool(host) and host[-1].isdigit() and bool(_IPV4.match(host))
+    relative, port = value[end:], ""
+    if relative[:1] == ":":
+        match = _RELATIVE_START.search(relative)
+        end = match.start() if match else len(relative)
+        port, relative = relative[1:end], relative[end:]
+        if not port.isdecimal():
+            return None
+    # The relative portion must be empty, `/`, or start with [/?#] & have no spaces.
+    if len(relative) > 1:
+        if relative[0] not in "/?#" or _WHITESPACE.search(relative):
+            return None
+    elif relative not in ("", "/"):
+        return None
+    return host, port, relative, is_ip
+
+
+def _scan_net_addr(value: str) -> Optional[_NetAddrPartsT]:
+    """Split a net-address into scheme, auth, password, host, port, and relative.
+
+    Each component is located with a forward scan and validated on its own, so
+    parsing is linear in the length of the input. Where a component is ambiguous,
+    we prefer the same interpretation as :py:data:`NET_ADDR_PATTERN`.
+    """
+    i = value.find("://")
+    if i > -1 and _SCHEME_CHARS.issuperset(value[:i]):
+        parts = _scan_auth(value[:i], value[i + 3 :])
+        if parts:
+            return parts
+    return _scan_auth("", value)
+
+
+def _scan_auth(scheme: str, value: str) -> Optional[_NetAddrPartsT]:
+    # Auth looks like `user:pass@`, but any combination of [:@] will do.
+    first = _AUTH_SEP.search(value)
+    if first and first.start():
+        second = _AUTH_SEP.search(value, first.end())
+        if second:
+            parts = _scan_host(value[second.end() :])
+            if parts:
+                auth = value[: second.end()]
+                password = value[first.end() : second.start()]
+                return (scheme, auth, password, *parts)
+    parts = _scan_host(value)
+    return (scheme, "", "", *parts) if parts else None
+
+
+def _split_relative(relative: str) -> Tuple[str, str, str, str]:
+    """Split the relative part of an address into path, params, query and fragment.
+
+    Matches :py:func:`urllib.parse.urlparse` for input with no scheme or netloc.
+    """
+    path, _, fragment = relative.partition("#")
+    path, _, qs = path.partition("?")
+    # Like urlparse, params only attach to the last path segment.
+    i = path.find(";", path.rfind("/") if "/" in path else 0)
+    if i < 0:
+        return path, "", qs, fragment
+    return path[:i], path[i + 1 :], qs, fragment
+
+
+PRIVATE_HOSTS = frozenset({"localhost", "127.0.0.1"})
+INTERNAL_HOSTS = PRIVATE_HOSTS | frozenset({"0.0.0.0"})
 
 
 class NetworkAddressValueError(ValueError):
@@ -130,40 +216,35 @@ class NetAddrInfo:
     fragment: str
     """The uri fragment, e.g. `#some-page-anchor`"""
     is_ip: bool = False
+    is_default_port: bool = dataclasses.field(init=False, repr=False, compare=False)
+    """Whether address is using the default port assigned to the given scheme."""
+    is_relative: bool = dataclasses.field(init=False, repr=False, compare=False)
+    """Whether address is 'relative' (i.e., whether a scheme is provided)."""
+    is_absolute: bool = dataclasses.field(init=False, repr=False, compare=False)
+    """The opposite of `is_relative`."""
+    is_private: bool = dataclasses.field(init=False, repr=False, compare=False)
+    """Whether or not the URL is using a 'private' host, i.e., 'localhost'."""
 
     PATTERN: ClassVar[Pattern] = NET_ADDR_PATTERN
-    DEFAULT_PORTS: ClassVar[Dict] = DEFAULT_PORTS
-    PRIVATE_HOSTS: ClassVar[Set[str]] = PRIVATE_HOSTS
-    INTERNAL_HOSTS: ClassVar[Set[str]] = INTERNAL_HOSTS
+    DEFAULT_PORTS: ClassVar[Dict[str, FrozenSet[int]]] = DEFAULT_PORTS  # noqa: F811
+    PRIVATE_HOSTS: ClassVar[FrozenSet[str]] = PRIVATE_HOSTS
+    INTERNAL_HOSTS: ClassVar[FrozenSet[str]] = INTERNAL_HOSTS
+
+    def __post_init__(self):
+        # These are cheap enough to compute up-front, which saves a
+        # cached_property lookup on every first access.
+        default_ports = DEFAULT_PORT_SETS.get(self.scheme, NO_PORT)
+        object.__setattr__(self, "is_default_port", self.port in default_ports)
+        object.__setattr__(self, "is_relative", not self.scheme)
+        object.__setattr__(self, "is_absolute", bool(self.scheme))
+        object.__setattr__(self, "is_private", self.host in PRIVATE_HOSTS)
 
     @classmethod
     def from_str(cls, value) -> "NetAddrInfo":
-        """Parse a string, validate, and return an instance of :py:class:`NetAddrInfo`."""
-        match: Optional[Match] = cls.PATTERN.match(value)
-        if not match or not value:
-            raise NetworkAddressValueError(f"{value!r} is not a valid network address.")
-        scheme, host = match["scheme"] or "", match["host"] or ""
-        if scheme and not host:
-            raise NetworkAddressValueError(f"{value!r} is not a valid network address.")
-        # why re-invent the wheel here? this is fast and correct.
-        parsed: parse.ParseResult = parse.urlparse(match["relative"] or "")
-        # get/set the port
-        port = int(match["port"] or 0)
-        if port == 0 and cls.DEFAULT_PORTS[scheme]:
-            port = cls.DEFAULT_PORTS[scheme].copy().pop()
-
-        return cls(
-            scheme=scheme,
-            auth=match["auth"] or "",
-            password=SecretStr(match["password"] or ""),
-            host=host,
-            port=port,
-            path=parsed.path,
-            qs=parsed.query,
-            params=parsed.params,
-            fragment=parsed.fragment,
-            is_ip=bool(match["ipv4"] or match["ipv6"]),
-        )
+        """Parse a string, validate, and return an instance of :py:class:`NetAddrInfo`.
+
+        Results are cached by the input string, see :py:func:`clear_cache`."""
+        return _parse_net_addr(cls, value)  # type: ignore[arg-type]
 
     @cached_property
     def base(self) -> str:
@@ -190,39 +271,19 @@ class NetAddrInfo:
     @cached_property
     def address_encoded(self) -> str:
         """The fully-qualified network address, encoded."""
-        return parse.quote(self.address)  # type: ignore
+        return quote(self.address)
 
-    @cached_property
+    # Parsed info is cached and shared, so each access gets its own mapping.
+    @property
     def query(self) -> Mapping[str, List[str]]:
         """The query-string, parsed into a mapping of key -> [values, ...]."""
         return MappingProxyType(parse.parse_qs(self.qs) if self.qs else {})
 
-    @cached_property
+    @property
     def parameters(self) -> Mapping[str, List[str]]:
         """The params, parsed into a mapping of key -> [values, ...]."""
         return MappingProxyType(parse.parse_qs(self.params) if self.params else {})
 
-    @cached_property
-    def is_default_port(self) -> bool:
-        """Whether address is using the default port assigned to the given scheme."""
-        defaults = DEFAULT_PORTS[self.scheme] | {0}
-        return self.port in defaults
-
-    @cached_property
-    def is_relative(self) -> bool:
-        """Whether address is 'relative' (i.e., whether a scheme is provided)."""
-        return not self.scheme
-
-    @cached_property
-    def is_absolute(self) -> bool:
-        """The opposite of `is_relative`."""
-        return not self.is_relative
-
-    @cached_property
-    def is_private(self) -> bool:
-        """Whether or not the URL is using a 'private' host, i.e., 'localhost'."""
-        return self.host in PRIVATE_HOSTS
-
     @cached_property
     def is_internal(self) -> bool:
         """Whether the host provided is an 'internal' host.
@@ -231,10 +292,41 @@ class NetAddrInfo:
         return bool(
             self.host
             and self.host in INTERNAL_HOSTS
-            or (self.is_ip and INTERNAL_IP_PATTERN.match(self.host))
+            or (self.is_ip and is_internal_ip(self.host))
         )
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_net_addr(cls: Type[NetAddrInfo], value: str) -> NetAddrInfo:
+    parts = _scan_net_addr(value) if value else None
+    if not parts:
+        raise NetworkAddressValueError(f"{value!r} is not a valid network address.")
+    scheme, auth, password, host, portstr, relative, is_ip = parts
+    if scheme and not host:
+        raise NetworkAddressValueError(f"{value!r} is not a valid network address.")
+    path, params, qs, fragment = _split_relative(relative)
+    # get/set the port
+    port = int(portstr or 0) or DEFAULT_PORT.get(scheme, 0)
+
+    return cls(
+        scheme=scheme,
+        auth=auth,
+        password=SecretStr(password) if password else EMPTY_SECRET,
+        host=host,
+        port=port,
+        path=path,
+        qs=qs,
+        params=params,
+        fragment=fragment,
+        is_ip=is_ip,
+    )
+
+
+def clear_cache():
+    """Clear the cache of parsed network addresses."""
+    _parse_net_addr.cache_clear()
+
+
 # Deepcopy is broken for frozen dataclasses with slots.
 # https://github.com/python/cpython/pull/17254
 # NetAddrInfo.__slots__ = tuple(
@@ -312,6 +404,19 @@ class NetworkAddress(str):
     def info(self) -> NetAddrInfo:
         return NetAddrInfo.from_str(self)
 
+    @classmethod
+    def _trusted(cls, value: str, info: NetAddrInfo):
+        """Create an instance from a value which is known to be valid, and its info.
+
+        User-defined subclasses may validate in `__new__`, so they always go through
+        the public constructor.
+        """
+        if cls.__new__ not in _TRUSTED_CONSTRUCTORS:
+            return cls(value)
+        v = super().__new__(cls, value)  # type: ignore
+        v.__dict__["info"] = info
+        return v
+
 
 class URLValueError(NetworkAddressValueError):
     """Generic error for an invalid value passed to URL."""
@@ -352,15 +457,44 @@ class URL(NetworkAddress):
         This works roughly like :py:meth:`pathlib.Path.joinpath`.
 
         Unlike :py:func:`urllib.parse.urljoin`, this method allows the user to build
-        onto existing paths.
+        onto existing paths. The params, query and fragment of `other` are kept.
         """
         cls = type(self)
-        # best guess at the path
-        other_info: NetAddrInfo = cls(other).info  # type: ignore
         self_info: NetAddrInfo = self.info  # type: ignore
-        other = (other_info.path or parse.urlparse(other).path or "").lstrip("/")
-        other = f"{self_info.path.rstrip('/') or ''}/{other}"
-        return cls(parse.urljoin(self_info.base, other))  # type: ignore
+        # Fast path: appending a single path segment, e.g. `url / "foo"`.
+        # A bare segment is parsed as a host below, so it must be a valid one.
+        if (
+            isinstance(other, str)
+            and (_PATH_SEGMENT.match(other) if other[:1] == "/" else _HOST.match(other))
+            and (self_info.scheme or not self_info.base)
+            and "/." not in self_info.path
+        ):
+            path = f"{self_info.path.rstrip('/')}/{other.lstrip('/')}"
+            info = dataclasses.replace(
+                self_info, path=path, params="", qs="", fragment=""
+            )
+            return cls._trusted(f"{self_info.base}{path}", info)  # type: ignore
+        # `other` is parsed on its own rather than as an instance of `cls`.
+        # Only the base of an absolute address is dropped, everything else is kept.
+        if other[:1] == "/":
+            other_info = NetAddrInfo.from_str(f"/{other.lstrip('/')}")
+        else:
+            other_info = NetAddrInfo.from_str(other)
+        relative = other_info.relative
+        if not other_info.scheme:
+            relative = f"{other_info.base}{relative}"
+        other = f"{self_info.path.rstrip('/') or ''}/{relative.lstrip('/')}"
+        base = self_info.base
+        joined = parse.urljoin(base, other)
+        relative = joined[len(base) :]
+        # We already know the base is valid, so skip re-parsing the whole address.
+        if joined.startswith(base) and relative.startswith("/"):
+            path, params, qs, fragment = _split_relative(relative)
+            info = dataclasses.replace(
+                self_info, path=path, params=params, qs=qs, fragment=fragment
+            )
+            return cls._trusted(joined, info)  # type: ignore
+        return cls(joined)  # type: ignore
 
     def __truediv__(self, other) -> "URL":
         """Overloading some operators to make it easier. Uses `:py:meth:`URL.join`."""
@@ -408,6 +542,12 @@ class RelativeURL(URL):
         return v
 
 
+# Constructors whose only validation is parsing the address (and checking the scheme).
+_TRUSTED_CONSTRUCTORS = frozenset(
+    (NetworkAddress.__new__, AbsoluteURL.__new__, RelativeURL.__new__)
+)
+
+
 class HostNameValueError(NetworkAddressValueError):
     pass
 
@@ -427,7 +567,25 @@ class HostName(NetworkAddress):
     """
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = str.__new__(cls, *args, **kwargs)
+        # Without a `:` or `@` there can be no scheme, auth, or port to look for,
+        # so scanning the host is enough.
+        parts = None if ":" in v or "@" in v else _scan_host(v)
+        if parts and parts[0] and not parts[2]:
+            host, _, _, is_ip = parts
+            v.__dict__["info"] = NetAddrInfo(
+                scheme="",
+                auth="",
+                password=EMPTY_SECRET,
+                host=host,
+                port=0,
+                path="",
+                qs="",
+                params="",
+                fragment="",
+                is_ip=is_ip,
+            )
+            return v
         if not v.info.host or any((v.info.scheme, v.info.auth, v.info.relative)):
             raise HostNameValueError(f"<{v!r}> is not a hostname.") from None
         return v